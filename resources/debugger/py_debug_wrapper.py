@@ -1,7 +1,9 @@
 import os
-import runpy
 import sys
-import re
+
+# debugpy emits logs in small fragments; write them to the underlying byte buffer and only flush on
+# message boundaries so we don't pay a syscall per fragment
+_stdout = sys.stdout.buffer
 
 # gives us access to debugpy's log information so we can emit a 'wait_for_client()' message
 class Pipe:
@@ -14,16 +16,19 @@ class Pipe:
         if 'wait_for_client' in message:
             print('Debugger waiting for client...')
             self.flush()
-        
-        # debugpy log messages look like this I+xxxxx.xxx: where x is a number we don't want to pipe those 
+
+        # debugpy log messages look like this I+xxxxx.xxx: where x is a number we don't want to pipe those
         # to stderr as it will clutter the debug console (unless we are in debug mode)
-        # however, we do want to output actual errors without debug mode to let the user know something 
+        # however, we do want to output actual errors without debug mode to let the user know something
         # went wrong with starting debugpy
-        if not re.search('(I|D)\+[0-9]+\.[0-9]+:', message) or self.debug:  
-            sys.stdout.write(message)
+        # the I+/D+ marker is always at the start of a log line, so two character checks replace the regex
+        is_log = len(message) >= 3 and message[0] in 'ID' and message[1] == '+'
+        if self.debug or not is_log:
+            _stdout.write(message.encode('utf-8', 'replace'))
 
     def flush(self):
         sys.stdout.flush()
+        _stdout.flush()
 
 if __name__ == '__main__':
     # debugger will be available in the task root if we patched the user's requirements.txt correctly
@@ -42,5 +47,8 @@ if __name__ == '__main__':
     # intercept stderr so we can process it
     sys.stderr = Pipe(debuggingMode)
 
-    # pretend like we invoked the debugger like: python -m <debugger_name>
-    runpy.run_module('debugpy', run_name='__main__')
+    # invoke debugpy's documented CLI entry point directly; this is what 'python -m debugpy' runs,
+    # minus runpy's module re-resolution and code-object compile on every debug session
+    # (the import must happen after the task root is on sys.path)
+    from debugpy.server import cli
+    cli.main()